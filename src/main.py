@@ -1,6 +1,7 @@
 # Import required libraries, drivers, and manager classes
-import os, io, time, machine, socket, sys
-from machine import SPI, Pin
+import os, io, json, machine, sys, asyncio
+from micropython import const
+from machine import SoftSPI, Pin
 from managers.DisplayManager import DisplayManager
 from managers.FileManager import FileManager
 from managers.StationManager import StationManager
@@ -12,31 +13,35 @@ from drivers.XPT2046 import Touch
 from updater import UpdateManager
 
 # Configuration constants
-WLAN_TIMEOUT = 30           # Timeout in seconds for WLAN connection attempts
-REQUEST_TIMEOUT = 5         # Timeout in seconds for network requests
-UPDATE_HOUR = 3             # Hour of the day (24-hour format) when automatic updates are checked
-LOOP_DELAY = 0.2            # Delay in seconds for the main loop iteration
+_WLAN_TIMEOUT = const(30)             # Timeout in seconds for WLAN connection attempts
+_REQUEST_TIMEOUT = const(5)           # Timeout in seconds for network requests
+_UPDATE_HOUR = const(3)               # Hour of the day (24-hour format) when automatic updates are checked
+_DATA_UPDATE_INTERVAL = const(300)    # Interval in seconds between weather and station data updates
+_DATA_UPDATE_OFFSET = const(61)       # Offset in seconds of the data updates within the interval (XX:01:01, XX:06:01, etc.)
+_STATE_MAX_AGE = const(3600)          # Maximum age in seconds of a saved display state to be restored after a reset
+_STATE_CONFIGURATION_NAMES = ("weather_lat", "weather_long", "station_ids", "fuel_type") # Configuration values a saved state depends on
 
 # Time tuple indices for readability
-T_DAY = 2
-T_HOUR = 3
-T_MINUTE = 4
-T_SECOND = 5
-
-# Set a global timeout for socket operations to prevent indefinite blocking
-socket.socket().settimeout(REQUEST_TIMEOUT)
+_T_DAY = const(2)
+_T_HOUR = const(3)
+_T_MINUTE = const(4)
+_T_SECOND = const(5)
 
 # Initialize manager instances
 fmgr = FileManager()
 dspm = DisplayManager(XglcdFont("fonts/ILIFont10x19.c", 10, 19), XglcdFont("fonts/PriceFont15x33.c", 15, 33))
-upmr = UpdateManager()
+upmr = UpdateManager(_REQUEST_TIMEOUT)
+
+# Touch controller, created once and used on the error screen. Software SPI keeps
+# the hardware SPI bus 1 free for the SD card, which uses it with different pins.
+tch = Touch(SoftSPI(baudrate=2000000, polarity=0, phase=0, sck=Pin(7), mosi=Pin(5), miso=Pin(4)), Pin(6), Pin(3), 2)
 
 def exit_if_process_fails(error_code, error_text, display_manager, file_manager, wlan_manager=None):
     """
     Handles critical errors by displaying an error screen and restarting the device.
     If the error code starts with '1', it waits for a touch input before restarting.
     """
-    if error_code is not "OK":
+    if error_code != "OK":
         # Get QR code image for the specific error and display it
         qr_code = file_manager.get_image_file("error", error_code)
         display_manager.draw_error(error_code, error_text, qr_code)
@@ -48,11 +53,10 @@ def exit_if_process_fails(error_code, error_text, display_manager, file_manager,
 
         # If error code indicates a user-recoverable error (e.g., config issue), wait for touch
         if error_code[0] == "1":
-            # Initialize touch screen for user interaction
-            touch_spi = SPI(1, baudrate=2000000, polarity=0, phase=0, sck=Pin(7), mosi=Pin(5), miso=Pin(4))
-            touch_manager = Touch(touch_spi, Pin(6), Pin(3), 2)
-            while not touch_manager.is_touched():
-                pass # Wait indefinitely until screen is touched
+            # Let the touch IRQ pin (PENIRQ, active low) wake the chip from light sleep
+            tch.irq.irq(trigger=Pin.WAKE_LOW, wake=machine.SLEEP)
+            while not tch.is_touched():
+                machine.lightsleep() # Sleep until the screen is touched, re-check on wakeup
         
         # Reset the device after handling the error
         machine.reset()
@@ -78,9 +82,149 @@ def update_firmware(display_manager, update_manager, file_manager, wlan_manager)
         os.rename("updater.py", "main.py") # New updater.py becomes main.py to handle the actual update
         machine.reset() # Reboot to run the the updater script
 
-def main():
+def save_state(display_manager, time_manager, configuration):
+    """
+    Saves the displayed weather and station data and the timezone to the RTC memory, which survives resets.
+    The configuration values the data depends on are saved along with it.
+    """
+    state = {
+        "time": time_manager.get_epoch(),
+        "tz_offset": time_manager.get_tz_offset(),
+        "timezone": time_manager.get_tz_identifier(),
+        "weather_data": display_manager.currently_displayed["weather_data"],
+        "weather_icon_name": display_manager.currently_displayed["weather_icon_name"],
+        "station_statuses": display_manager.currently_displayed["station_statuses"],
+        "fuel_prices": display_manager.currently_displayed["fuel_prices"]
+    }
+    for name in _STATE_CONFIGURATION_NAMES:
+        state[name] = configuration[name]
+    machine.RTC().memory(json.dumps(state).encode())
+
+def restore_state(time_manager, configuration):
+    """
+    Loads the state saved by save_state from the RTC memory, if it is recent enough to be displayed.
+    Returns the state as a dictionary, or None if there is no usable state.
+    """
+    try:
+        state = json.loads(machine.RTC().memory())
+        if not 0 <= time_manager.get_epoch() - state["time"] < _STATE_MAX_AGE:
+            return None
+
+        # The data must belong to the current configuration, compared as JSON so floats match after the round trip
+        for name in _STATE_CONFIGURATION_NAMES:
+            if json.dumps(state[name]) != json.dumps(configuration[name]):
+                return None
+
+        # The state may come from another firmware version, so everything that gets drawn is checked
+        if not isinstance(state["tz_offset"], int) or not isinstance(state["timezone"], str):
+            return None
+        if not isinstance(state["weather_icon_name"], str):
+            return None
+        for name, max_length in (("weather_data", 4), ("station_statuses", 3), ("fuel_prices", 3)):
+            values = state[name]
+            if not isinstance(values, list) or len(values) > max_length or not all(isinstance(v, str) for v in values):
+                return None
+        return state
+    except Exception:
+        return None
+
+async def clock_task(display_manager, time_manager):
+    """
+    Updates the weekday, date, and time on the display at the start of every minute.
+    """
+    while True:
+        now = time_manager.get_snapshot()
+        display_manager.draw_weekday_date_time(now.timedate)
+        await asyncio.sleep(60 - now.timestamp[_T_SECOND])
+
+async def sync_task(display_manager, file_manager, wlan_manager, time_manager):
+    """
+    Syncs the NTP clock and sets the timezone (relevant for summer/winter time switching) at the start of every hour.
+    """
+    while True:
+        t = time_manager.get_timestamp()
+        await asyncio.sleep((59 - t[_T_MINUTE]) * 60 + 60 - t[_T_SECOND])
+        exit_if_process_fails(*wlan_manager.is_connected(), display_manager, file_manager, wlan_manager)
+        exit_if_process_fails(*wlan_manager.device_online(), display_manager, file_manager, wlan_manager)
+        exit_if_process_fails(*time_manager.sync_time(), display_manager, file_manager, wlan_manager)
+        time_manager.set_timezone()
+
+async def update_check_task(time_manager, update_check_due):
+    """
+    Marks the firmware update check as due every day at the start of the update hour, or at startup during the update hour.
+    The check itself runs with the next data update, after the connection has been checked.
+    """
+    last_check_day = None
+    while True:
+        # Check the local hour at startup, so a reset during the update hour doesn't skip the check,
+        # and at every full hour, as the timezone may have changed (summer/winter time).
+        # The day guards against marking the check as due twice on the same day.
+        t = time_manager.get_timestamp()
+        if t[_T_HOUR] == _UPDATE_HOUR and t[_T_DAY] != last_check_day:
+            last_check_day = t[_T_DAY]
+            update_check_due.set()
+
+        await asyncio.sleep((59 - t[_T_MINUTE]) * 60 + 60 - t[_T_SECOND])
+
+def get_next_data_update(epoch):
+    """
+    Calculates the epoch of the next data update after the given epoch.
+    Timezone offsets are multiples of 15 minutes, so the UTC alignment matches the local one.
+    """
+    return ((epoch - _DATA_UPDATE_OFFSET) // _DATA_UPDATE_INTERVAL + 1) * _DATA_UPDATE_INTERVAL + _DATA_UPDATE_OFFSET
+
+async def data_task(display_manager, update_manager, file_manager, wlan_manager, time_manager, weather_manager, station_manager, update_check_due, configuration):
     """
-    Main function to initialize the system, connect to WLAN, synchronize time, fetch data, and run the display loop.
+    Fetches and displays weather and station data every 5 minutes at XX:01, XX:06, XX:11, etc.
+    This is because of the station opening times, which get precise updates at these times.
+    Example: A station closes at 23:00. When fetching data from tankerkeonig API at 23:00,
+             the station appears to be open. When fetching at 23:01, it will appear as closed.
+    """
+    next_data_update = get_next_data_update(time_manager.get_epoch())
+
+    while True:
+        await asyncio.sleep(max(0, next_data_update - time_manager.get_epoch()))
+        now = time_manager.get_snapshot()
+
+        # Woke up before the update is due (e.g., the NTP sync moved the clock back), sleep the rest of the time
+        if now.epoch < next_data_update:
+            continue
+
+        # Schedule the next update, realign if this one is late by a full interval or more
+        if now.epoch - next_data_update >= _DATA_UPDATE_INTERVAL:
+            next_data_update = get_next_data_update(now.epoch)
+        else:
+            next_data_update += _DATA_UPDATE_INTERVAL
+
+        exit_if_process_fails(*wlan_manager.is_connected(), display_manager, file_manager, wlan_manager)
+        exit_if_process_fails(*wlan_manager.device_online(), display_manager, file_manager, wlan_manager)
+        if not now.timezone_set:
+            time_manager.set_timezone()
+            now = time_manager.get_snapshot() # The timezone may have changed
+
+        # Check for firmware updates once a day, if marked as due by the update check task
+        if update_check_due.is_set():
+            update_check_due.clear()
+            update_firmware(display_manager, update_manager, file_manager, wlan_manager)
+
+        # Send the weather and station requests first, so both are processed by the servers at the same time
+        weather_request = weather_manager.start_request(now.timestamp, now.tz_identifier)
+        station_request = station_manager.start_request()
+
+        # Fetch and display weather data
+        weather_data, weather_icon_name = await weather_manager.finish_request(weather_request, now.timestamp)
+        if(display_manager.currently_displayed.get("weather_icon_name") != weather_icon_name):
+            display_manager.draw_weather_data(weather_data, weather_icon_name, file_manager.get_image_file("weather", weather_icon_name))
+        else:
+            display_manager.draw_weather_data(weather_data, weather_icon_name)
+
+        # Fetch and display station data
+        display_manager.draw_station_data(*await station_manager.finish_request(station_request))
+        save_state(display_manager, time_manager, configuration)
+
+async def main():
+    """
+    Main function to initialize the system, connect to WLAN, synchronize time, fetch data, and run the display tasks.
     """
     # Initial display: "Please wait..."
     dspm.draw_waiting_screen()
@@ -89,126 +233,113 @@ def main():
     exit_if_process_fails(*fmgr.open_sd_card(), dspm, fmgr)
     exit_if_process_fails(*fmgr.validate_sd_card_contents(), dspm, fmgr)
 
+    # Resolve all configuration values once
+    configuration = fmgr.get_all_configuration_values()
+    wlan_ssid = configuration["wlan_ssid"]
+    wlan_psk = configuration["wlan_psk"]
+    weather_lat = configuration["weather_lat"]
+    weather_long = configuration["weather_long"]
+    station_ids = configuration["station_ids"]
+    station_labels = configuration["station_labels"]
+    fuel_type = configuration["fuel_type"]
+    tankerkoenig_api_key = configuration["tankerkoenig_api_key"]
+    automatic_updates = configuration["automatic_updates"]
+
+    # Load all images needed during startup in a single pass over the file system,
+    # stations sharing the same icon get the same image data
+    station_names = [label[0] for label in station_labels]
+    weather_symbol_names = ["thermometer", "raindrop", "lowest-temperature", "highest-temperature"]
+    images = fmgr.get_image_files([("symbol", "wlan")] +
+                                  [("symbol", name) for name in weather_symbol_names] +
+                                  [("station", name) for name in station_names])
+    station_icons = [images[("station", name)] for name in station_names]
+    weather_symbols = [images[("symbol", name)] for name in weather_symbol_names]
+
+    # Keep all weather icons in RAM, so weather icon changes don't require file system access
+    fmgr.preload_image_files("weather")
+
+    # After a recent reset, show the last displayed data right away while the device reconnects,
+    # otherwise show the WLAN waiting screen
+    tmgr = TimeManager(_REQUEST_TIMEOUT)
+    state = restore_state(tmgr, configuration)
+    if state is not None:
+        tmgr.restore_timezone(state["tz_offset"], state["timezone"])
+        dspm.draw_main_layout(station_icons, weather_symbols, station_labels, fuel_type)
+        dspm.draw_weather_data(state["weather_data"], state["weather_icon_name"], fmgr.get_image_file("weather", state["weather_icon_name"]))
+        dspm.draw_station_data(state["station_statuses"], state["fuel_prices"])
+        clock = asyncio.create_task(clock_task(dspm, tmgr))
+    else:
+        dspm.draw_waiting_for_wlan(images[("symbol", "wlan")], wlan_ssid)
+    del images # Free the image buffers, the remaining ones are referenced by the lists above
+
     # WLAN connection
-    wlnm = WlanManager()
-    wlnm.connect(fmgr.get_configuration_value("wlan_ssid"), fmgr.get_configuration_value("wlan_psk"))
-    dspm.draw_waiting_for_wlan(fmgr.get_image_file("symbol", "wlan"), fmgr.get_configuration_value("wlan_ssid"))
-    for i in range(WLAN_TIMEOUT + 1):
-        dspm.draw_wlan_waiting_time(WLAN_TIMEOUT - i)
+    wlnm = WlanManager(_REQUEST_TIMEOUT)
+    wlnm.connect(wlan_ssid, wlan_psk)
+    for i in range(_WLAN_TIMEOUT + 1):
+        if state is None:
+            dspm.draw_wlan_waiting_time(_WLAN_TIMEOUT - i)
         if wlnm.is_connected_boolean():
             break
-        time.sleep(1)
+        await asyncio.sleep(1)
     
     # Check for successful WLAN connection and internet access
     exit_if_process_fails(*wlnm.is_connected(), dspm, fmgr, wlnm)
     exit_if_process_fails(*wlnm.device_online(), dspm, fmgr, wlnm)
 
     # Time synchronization and timezone setup
-    tmgr = TimeManager()
     exit_if_process_fails(*tmgr.sync_time(), dspm, fmgr, wlnm)
     tmgr.set_timezone()
 
     # Initialize data managers
-    wmgr = WeatherManager(fmgr.get_configuration_value("weather_lat"), fmgr.get_configuration_value("weather_long"))
-    stmr = StationManager(fmgr.get_configuration_value("station_ids"),
-                          fmgr.get_configuration_value("fuel_type"),
-                          fmgr.get_configuration_value("tankerkoenig_api_key"))
-
-    # Draw the main layout of the display
-    dspm.draw_main_layout(
-        [fmgr.get_image_file("station", label[0]) for label in fmgr.get_configuration_value("station_labels")],
-        [fmgr.get_image_file("symbol", "thermometer"), 
-        fmgr.get_image_file("symbol", "raindrop"),
-        fmgr.get_image_file("symbol", "lowest-temperature"),
-        fmgr.get_image_file("symbol", "highest-temperature")],
-        fmgr.get_configuration_value("station_labels"),
-        fmgr.get_configuration_value("fuel_type")
-    )
+    wmgr = WeatherManager(weather_lat, weather_long, _REQUEST_TIMEOUT)
+    stmr = StationManager(station_ids, fuel_type, tankerkoenig_api_key, _REQUEST_TIMEOUT)
+
+    # Draw the main layout of the display, unless the restored state is already shown
+    if state is None:
+        dspm.draw_main_layout(station_icons, weather_symbols, station_labels, fuel_type)
+        clock = asyncio.create_task(clock_task(dspm, tmgr))
+    del station_icons, weather_symbols # Free the image buffers, they are not needed after startup
     
-    # Initial data fetch and display
-    dspm.draw_weekday_date_time(tmgr.get_timedate())
-    weather_data, weather_icon_name = wmgr.get_weather_data(tmgr.get_timestamp(), tmgr.get_tz_identifier())
+    # Initial data fetch and display, only changed values are redrawn
+    now = tmgr.get_snapshot()
+    weather_request = wmgr.start_request(now.timestamp, now.tz_identifier)
+    station_request = stmr.start_request()
+    weather_data, weather_icon_name = await wmgr.finish_request(weather_request, now.timestamp)
     dspm.draw_weather_data(weather_data, weather_icon_name, fmgr.get_image_file("weather", weather_icon_name))
-    dspm.draw_station_data(*stmr.get_station_data())
+    dspm.draw_station_data(*await stmr.finish_request(station_request))
+    save_state(dspm, tmgr, configuration)
 
-    # Variables for main loop control
-    previous_day = -1
-    previous_hour = -1
-    previous_minute = -1
-    data_can_be_updated = False
-    perform_update_check = False
-
-    # Main loop, runs (technically) forever until the next firmware update
-    while True:
-        t = tmgr.get_timestamp()
-
-        # Daily tasks, re-enable update check for the new day
-        if previous_day != t[T_DAY]:
-            previous_day = t[T_DAY]
-            perform_update_check = True
-
-        # Hourly tasks, sync NTP clock, set timezone (relevant for summer/winter time switching)
-        if previous_hour != t[T_HOUR]:
-            previous_hour = t[T_HOUR]
-            exit_if_process_fails(*wlnm.is_connected(), dspm, fmgr, wlnm)
-            exit_if_process_fails(*wlnm.device_online(), dspm, fmgr, wlnm)
-            exit_if_process_fails(*tmgr.sync_time(), dspm, fmgr, wlnm)
-            tmgr.set_timezone()
-
-        # Minute-by-minute tasks, update time and date on display
-        if previous_minute != t[T_MINUTE]:
-            previous_minute = t[T_MINUTE]
-            dspm.draw_weekday_date_time(tmgr.get_timedate())
-
-        # Control flag to allow data updates once every 5 minutes
-        if (t[T_MINUTE] - 1) % 5 != 0 and not data_can_be_updated:
-            data_can_be_updated = True
-
-        # Data update logic, runs every 5 minutes at XX:01, XX:06, XX:11, etc.
-        # This is because of the station opening times, which get precise updates at these times.
-        # Example: A station closes at 23:00. When fetching data from tankerkeonig API at 23:00,
-        #          the station appears to be open. When fetching at 23:01, it will appear as closed.
-        if (data_can_be_updated and t[T_SECOND] >= 1 and (t[T_MINUTE] - 1) % 5 == 0):
-            data_can_be_updated = False
-            exit_if_process_fails(*wlnm.is_connected(), dspm, fmgr, wlnm)
-            exit_if_process_fails(*wlnm.device_online(), dspm, fmgr, wlnm)
-            if not tmgr.get_timezone_set():
-                tmgr.set_timezone()
-
-            # Check for firmware updates if enabled and at the specified hour and perform a timezone update.
-            # The timezone update ensures
-            if (fmgr.get_configuration_value("automatic_updates") and perform_update_check and t[T_HOUR] == UPDATE_HOUR):
-                update_firmware(dspm, upmr, fmgr, wlnm)
-                perform_update_check = False
-            
-            # Fetch and display weather data
-            weather_data, weather_icon_name = wmgr.get_weather_data(t, tmgr.get_tz_identifier())
-            if(dspm.currently_displayed.get("weather_icon_name") != weather_icon_name):
-                dspm.draw_weather_data(weather_data, weather_icon_name, fmgr.get_image_file("weather", weather_icon_name))
-            else:
-                dspm.draw_weather_data(weather_data, weather_icon_name)
-            
-            # Fetch and display station data
-            dspm.draw_station_data(*stmr.get_station_data())
-
-        # Take a short nap    
-        time.sleep(LOOP_DELAY)
+    # Run the display tasks, (technically) forever until the next firmware update.
+    # Network requests are awaited, so the clock keeps ticking while data is fetched.
+    # Every task sleeps until its next scheduled time slot instead of polling the clock.
+    update_check_due = asyncio.Event()
+    tasks = [
+        clock,
+        asyncio.create_task(sync_task(dspm, fmgr, wlnm, tmgr)),
+        asyncio.create_task(data_task(dspm, upmr, fmgr, wlnm, tmgr, wmgr, stmr, update_check_due, configuration))
+    ]
+    if automatic_updates:
+        tasks.append(asyncio.create_task(update_check_task(tmgr, update_check_due)))
+    await asyncio.gather(*tasks)
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
     except Exception as e:
         # Generic error handler for unexpected exceptions
         # For better debugging, extract human-readable error message,
         # format it for 1-2 lines (max. 84 characters error message)
         # and print corresponding most recent call file name and line number
+        # (MicroPython keeps no traceback objects, so the printed traceback is the only source)
         string_io = io.StringIO()
         sys.print_exception(e, string_io)
-        traceback_info = string_io.getvalue().split('\n')[-3].replace('"', ',').replace(',', ',').split(',')
-        err_file_name = traceback_info[1].strip().split("/")[-1]
-        err_line_number = traceback_info[3].strip().replace('line ', '')
-        err_text = str(e)[0].upper() + str(e)[1:84]
-        err_lines = [err_text[i:i + 42] for i in range(0, len(err_text), 42)]
+        # Last call line of the traceback, e.g.: File "managers/FileManager.py", line 42, in get_image_file
+        traceback_info = string_io.getvalue().rsplit('\n', 3)[1].split('"')
+        err_file_name = traceback_info[1].rsplit("/", 1)[-1]
+        err_line_number = traceback_info[2].split(",", 2)[1].strip().replace('line ', '')
+        err_text = str(e)
+        err_text = err_text[:1].upper() + err_text[1:84]
+        err_lines = [err_text[:42], err_text[42:]] if len(err_text) > 42 else [err_text]
         dspm.draw_waiting_screen()
         exit_if_process_fails(*fmgr.open_sd_card(), dspm, fmgr)
         exit_if_process_fails("1000", ["An unexpected error occured:"] +
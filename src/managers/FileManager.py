@@ -5,6 +5,8 @@ from drivers.sdcard import SDCard
 
 class FileManager:
     """Manages file system operations, including SD card access and configuration validation."""
+    __CACHED_IMAGE_CATEGORIES = ("weather",) # Image categories that are kept in RAM once they have been read
+
     def __init__(self):
         """
         Initializes the FileManager, setting up configuration storage and regex for UUID validation.
@@ -12,6 +14,7 @@ class FileManager:
         self.configuration = {}
         self.uuid_regex = ure.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
         self.sd = None
+        self.image_cache = {}
         
     def open_sd_card(self):
         """
@@ -313,35 +316,57 @@ class FileManager:
         else:
             return configuration
         
-    def get_image_file(self, image_category, image_name):
+    def get_all_configuration_values(self):
         """
-        Retrieves image data from the SD card based on category and name.
-        Provides fallback images if the requested image is not found.
+        Retrieves all configuration values at once, handling type conversion for numbers.
+
+        Returns:
+            dict: A dictionary mapping each configuration name to its value.
+        """
+        return {name: self.get_configuration_value(name) for name in self.configuration}
+
+    def __get_image_folder(self, image_category):
+        """
+        Resolves the folder and fallback image path for an image category.
 
         Args:
             image_category (str): The category of the image (e.g., "station", "weather", "error", "symbol").
-            image_name (str): The name of the image file (without extension).
 
         Returns:
-            bytes: The binary data of the image file.
+            tuple: The folder path and the fallback image path (or None if there is no fallback).
 
         Raises:
             Exception: If an unknown image category is provided.
         """
         if image_category == "station":
-            folder = "/sd/station_icons"
-            fallback = "/symbols/unknown-station.rgb666"
+            return "/sd/station_icons", "/symbols/unknown-station.rgb666"
         elif image_category == "weather":
-            folder = "/weather_icons"
-            fallback = None
+            return "/weather_icons", None
         elif image_category == "error":
-            folder = "/errors"
-            fallback = None
+            return "/errors", None
         elif image_category == "symbol":
-            folder = "/symbols"
-            fallback = None
+            return "/symbols", None
         else:
             raise Exception("Unknown Image Category!")
+
+    def get_image_file(self, image_category, image_name):
+        """
+        Retrieves image data from the SD card based on category and name.
+        Provides fallback images if the requested image is not found.
+
+        Args:
+            image_category (str): The category of the image (e.g., "station", "weather", "error", "symbol").
+            image_name (str): The name of the image file (without extension).
+
+        Returns:
+            bytes: The binary data of the image file.
+
+        Raises:
+            Exception: If an unknown image category is provided.
+        """
+        folder, fallback = self.__get_image_folder(image_category)
+        if (image_category, image_name) in self.image_cache:
+            return self.image_cache[(image_category, image_name)]
         
         try:
             filename = f"{image_name}.rgb666"
@@ -351,7 +376,68 @@ class FileManager:
             file_path = fallback
 
         with open(file_path, "rb") as f:
-            return f.read()
+            image = f.read()
+
+        if image_category in self.__CACHED_IMAGE_CATEGORIES:
+            self.image_cache[(image_category, image_name)] = image
+        return image
+
+    def get_image_files(self, image_requests):
+        """
+        Retrieves the image data of several images in one pass.
+        Every image folder is listed only once, the files are read folder by folder,
+        and images that are requested more than once (e.g., the same station icon) are read only once.
+
+        Args:
+            image_requests (list): A list of (image_category, image_name) tuples, duplicates are allowed.
+
+        Returns:
+            dict: A dictionary mapping each (image_category, image_name) tuple to the binary data of the image file.
+
+        Raises:
+            Exception: If an unknown image category is provided.
+        """
+        images = {}
+        folder_files = {}
+        for image_category, image_name in sorted(set(image_requests)):
+            folder, fallback = self.__get_image_folder(image_category)
+            if (image_category, image_name) in self.image_cache:
+                images[(image_category, image_name)] = self.image_cache[(image_category, image_name)]
+                continue
+
+            if folder not in folder_files:
+                try:
+                    folder_files[folder] = os.listdir(folder)
+                except Exception:
+                    folder_files[folder] = []
+
+            filename = f"{image_name}.rgb666"
+            file_path = f"{folder}/{filename}" if filename in folder_files[folder] else fallback
+            with open(file_path, "rb") as f:
+                images[(image_category, image_name)] = f.read()
+
+            if image_category in self.__CACHED_IMAGE_CATEGORIES:
+                self.image_cache[(image_category, image_name)] = images[(image_category, image_name)]
+
+        return images
+
+    def preload_image_files(self, image_category):
+        """
+        Reads all images of a cached image category into RAM, so later requests don't access the file system.
+
+        Args:
+            image_category (str): The category of the images to preload (e.g., "weather").
+
+        Raises:
+            Exception: If an unknown image category is provided.
+        """
+        folder, _ = self.__get_image_folder(image_category)
+        try:
+            files = os.listdir(folder)
+        except Exception:
+            return
+
+        self.get_image_files([(image_category, f[:-len(".rgb666")]) for f in files if f.endswith(".rgb666")])
         
     def close(self):
         """
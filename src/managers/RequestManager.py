@@ -0,0 +1,84 @@
+# Import required libraries
+import socket, ssl, select, json, time, asyncio
+
+class RequestManager:
+    """Manages HTTP GET requests that are sent first and answered later, so several requests can be in flight at once."""
+    __POLL_INTERVAL = 50 # Time in milliseconds between checks for a response, other tasks run in between
+
+    def __init__(self, request_timeout):
+        """
+        Initializes the RequestManager with the timeout used for all socket operations.
+
+        Args:
+            request_timeout (int): The timeout in seconds for connecting, sending, and receiving.
+        """
+        self.request_timeout = request_timeout
+
+    def start_request(self, url, headers=None):
+        """
+        Connects to the host of the given URL and sends a GET request without waiting for the response.
+
+        Args:
+            url (str): The URL to request (http or https).
+            headers (dict, optional): Additional request headers. Defaults to None.
+
+        Returns:
+            socket or None: The socket the response will arrive on, or None if the request could not be sent.
+        """
+        sock = None
+        try:
+            proto, _, host, path = url.split("/", 3)
+            port = 443 if proto == "https:" else 80
+            addr = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)[0]
+            sock = socket.socket(addr[0], socket.SOCK_STREAM, addr[2])
+            sock.settimeout(self.request_timeout)
+            sock.connect(addr[-1])
+            if port == 443:
+                sock = ssl.wrap_socket(sock, server_hostname=host)
+
+            request = f"GET /{path} HTTP/1.0\r\nHost: {host}\r\nConnection: close\r\n"
+            for name, value in (headers or {}).items():
+                request += f"{name}: {value}\r\n"
+            sock.write(request.encode() + b"\r\n")
+            return sock
+
+        except Exception:
+            if sock is not None:
+                sock.close()
+            return None
+
+    async def finish_request(self, sock):
+        """
+        Waits for the response of a previously started request without blocking other tasks and parses its JSON body.
+
+        Args:
+            sock (socket): The socket returned by `start_request`.
+
+        Returns:
+            any: The parsed JSON response body.
+
+        Raises:
+            Exception: If the request was not sent, timed out, or did not succeed.
+        """
+        if sock is None:
+            raise Exception("Request was not sent!")
+
+        try:
+            poller = select.poll()
+            poller.register(sock, select.POLLIN)
+            deadline = time.ticks_add(time.ticks_ms(), self.request_timeout * 1000)
+            while not poller.poll(0):
+                if time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+                    raise Exception("Request timed out!")
+                await asyncio.sleep_ms(self.__POLL_INTERVAL)
+
+            status = int(sock.readline().split(None, 2)[1])
+            while sock.readline() not in (b"\r\n", b""):
+                pass # Skip the response headers
+
+            if status != 200:
+                raise Exception(f"Request failed with status {status}!")
+            return json.loads(sock.read())
+
+        finally:
+            sock.close()
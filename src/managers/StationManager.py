@@ -1,5 +1,5 @@
-# Import requests library
-import urequests as requests
+# Import request manager
+from managers.RequestManager import RequestManager
 
 class StationManager:
     """Manages fetching and processing gas station data from the Tankerkoenig API."""
@@ -10,7 +10,7 @@ class StationManager:
         None: "STATUS UNKNOWN"
     }
     
-    def __init__(self, station_ids, fuel_type, api_key):
+    def __init__(self, station_ids, fuel_type, api_key, request_timeout):
         """
         Initializes the StationManager with station IDs, fuel type, and API key.
 
@@ -18,10 +18,12 @@ class StationManager:
             station_ids (list): A list of station UUIDs.
             fuel_type (str): The type of fuel to query (e.g., "e5", "e10", "diesel").
             api_key (str): The API key for the Tankerkoenig service.
+            request_timeout (int): The timeout in seconds for network requests.
         """
         self.station_ids = station_ids
         self.fuel_type = fuel_type
         self.base_url_station_info = f"https://creativecommons.tankerkoenig.de/json/prices.php?apikey={api_key}"
+        self.request_manager = RequestManager(request_timeout)
     
     def __get_station_status(self, data, station_id):
         """
@@ -59,17 +61,27 @@ class StationManager:
         except Exception:
             return "-,--"
         
-    def get_station_data(self):
+    def start_request(self):
         """
-        Fetches gas station statuses and fuel prices for all configured stations.
+        Sends the station request without waiting for the response.
+
+        Returns:
+            socket or None: The pending request, to be passed to `finish_request`.
+        """
+        return self.request_manager.start_request(f"{self.base_url_station_info}&ids={",".join(self.station_ids)}")
+
+    async def finish_request(self, pending_request):
+        """
+        Receives and processes the response of the request sent by `start_request`.
+
+        Args:
+            pending_request (socket or None): The pending request returned by `start_request`.
 
         Returns:
             tuple: A tuple containing two lists: station statuses and fuel prices.
         """
         try:
-            response = requests.get(f"{self.base_url_station_info}&ids={",".join(self.station_ids)}")
-            data = response.json()
-            response.close()
+            data = await self.request_manager.finish_request(pending_request)
             statuses = [self.__get_station_status(data, sid) for sid in self.station_ids]
             prices = [self.__get_station_fuel_price(data, sid) for sid in self.station_ids]
 
@@ -78,4 +90,3 @@ class StationManager:
             prices = ["-,--"] * len(self.station_ids)
 
         return statuses, prices
-
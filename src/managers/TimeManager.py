@@ -1,17 +1,23 @@
 # Import required libraries
 import ntptime, time
 import urequests as requests
+from collections import namedtuple
 
 class TimeManager:
     """Manages time synchronization and timezone settings for the device."""
 
     __WEEKDAYS = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
     __HEADERS = {"User-Agent": "ESP32-OTA-Updater"}
+    __Snapshot = namedtuple("Snapshot", ("epoch", "timestamp", "timedate", "tz_identifier", "timezone_set"))
 
-    def __init__(self):
+    def __init__(self, request_timeout):
         """
         Initializes the TimeManager, setting default timezone offset and sync status.
+
+        Args:
+            request_timeout (int): The timeout in seconds for network requests.
         """
+        self.request_timeout = request_timeout
         self.tz_offset = 0
         self.timezone = "Etc/UTC"
         self.synced = False
@@ -41,7 +47,7 @@ class TimeManager:
         Updates `self.tz_offset` and `self.timezone`.
         """
         try:
-            response = requests.get("https://ipapi.co/json", headers = self.__HEADERS)
+            response = requests.get("https://ipapi.co/json", headers = self.__HEADERS, timeout = self.request_timeout)
             data = response.json()
             response.close()
             offset = data["utc_offset"]
@@ -54,6 +60,27 @@ class TimeManager:
         except Exception:
             self.timezone_set = False
     
+    def restore_timezone(self, tz_offset, timezone):
+        """
+        Restores a previously determined timezone without contacting the external API.
+        The timezone is not marked as set, so it is still updated by the next `set_timezone` call.
+
+        Args:
+            tz_offset (int): The timezone offset from UTC in seconds.
+            timezone (str): The timezone identifier (e.g., "Europe/Berlin").
+        """
+        self.tz_offset = tz_offset
+        self.timezone = timezone
+
+    def get_tz_offset(self):
+        """
+        Returns the current timezone offset from UTC.
+
+        Returns:
+            int: The timezone offset in seconds.
+        """
+        return self.tz_offset
+
     def get_tz_identifier(self):
         """
         Returns the current timezone identifier.
@@ -72,6 +99,15 @@ class TimeManager:
         """
         return self.timezone_set
 
+    def get_epoch(self):
+        """
+        Returns the current UTC time in seconds since the epoch.
+
+        Returns:
+            int: The number of seconds since the epoch.
+        """
+        return self._time()
+
     def get_timestamp(self):
         """
         Returns the current local time as a timestamp tuple, adjusted for timezone offset.
@@ -88,7 +124,31 @@ class TimeManager:
         Returns:
             list: A list containing [weekday (str), date (str), time (str)].
         """
-        t = self.get_timestamp()
+        return self.__format_timedate(self.get_timestamp())
+
+    def get_snapshot(self):
+        """
+        Reads the clock once and returns all time and timezone information derived from this single reading.
+        A snapshot does not change, take a new one after calling `set_timezone`.
+
+        Returns:
+            namedtuple: A snapshot with the fields epoch (int), timestamp (tuple), timedate (list),
+                        tz_identifier (str), and timezone_set (bool).
+        """
+        epoch = self._time()
+        t = self._localtime(epoch + self.tz_offset)
+        return self.__Snapshot(epoch, t, self.__format_timedate(t), self.timezone, self.timezone_set)
+
+    def __format_timedate(self, t):
+        """
+        Formats a timestamp tuple as weekday, date, and time strings.
+
+        Args:
+            t (tuple): A time tuple (year, month, mday, hour, minute, second, weekday, yearday).
+
+        Returns:
+            list: A list containing [weekday (str), date (str), time (str)].
+        """
         return [
             self.__WEEKDAYS[t[6]],
             "{:02d}.{:02d}.{:04d}".format(t[2], t[1], t[0]),
@@ -1,18 +1,27 @@
-# Import requests library
-import urequests as requests
+# Import required libraries and request manager
+import time
+from managers.RequestManager import RequestManager
 
 class WeatherManager:
     """Manages fetching and processing weather data from the Brightsky API."""
-    def __init__(self, lat, long):
+    __CACHE_TTL = 600 # Time in seconds for which fetched weather data is reused instead of requested again
+
+    def __init__(self, lat, long, request_timeout):
         """
         Initializes the WeatherManager with geographical coordinates.
 
         Args:
             lat (float): The latitude for weather data.
             long (float): The longitude for weather data.
+            request_timeout (int): The timeout in seconds for network requests.
         """
         self.base_url_current_weather = f"https://api.brightsky.dev/current_weather?lat={lat}&lon={long}"
         self.base_url_weather = f"https://api.brightsky.dev/weather?lat={lat}&lon={long}"
+        self.request_manager = RequestManager(request_timeout)
+        self.location = f"{lat},{long}"
+        self.cache = None
+        self.pending_cache_key = None
+        self.pending_cache_time = None
 
     def __round_half_up(self, x):
             """
@@ -123,24 +132,82 @@ class WeatherManager:
         except Exception:
             return "unknown"
 
-    def get_weather_data(self, timestamp, timezone):
+    def __save_cache(self, cache_key, cache_time, weather_data, weather_icon_name):
+        """
+        Stores freshly fetched weather data in memory.
+
+        Args:
+            cache_key (str): The location, date, hour, and timezone the data belongs to.
+            cache_time (int): The time the requests for the data were sent.
+            weather_data (list): The processed weather data [current_temp, rain_prob, min_temp, max_temp].
+            weather_icon_name (str): The weather icon name.
+        """
+        self.cache = {
+            "key": cache_key,
+            "time": cache_time,
+            "weather_data": weather_data,
+            "weather_icon_name": weather_icon_name
+        }
+
+    def __cache_valid(self, cache_key):
+        """
+        Checks if the cached weather data belongs to the given key and is recent enough to be reused.
+
+        Args:
+            cache_key (str): The location, date, hour, and timezone the data is needed for.
+
+        Returns:
+            bool: True if the cached weather data can be reused, False otherwise.
+        """
+        return (self.cache is not None
+                and self.cache.get("key") == cache_key
+                and 0 <= time.time() - self.cache.get("time", 0) < self.__CACHE_TTL)
+
+    def start_request(self, timestamp, timezone):
         """
-        Fetches and processes current and forecasted weather data.
+        Sends the current and forecasted weather requests without waiting for the responses.
 
         Args:
             timestamp (tuple): A time tuple (year, month, mday, hour, ...).
             timezone (str): The timezone identifier (e.g., "Europe/Berlin").
 
+        Returns:
+            list or None: The pending current weather and forecast requests to be passed to `finish_request`,
+                          or None if the cached weather data is still valid.
+        """
+        date = "{:04d}-{:02d}-{:02d}".format(
+            timestamp[0], timestamp[1], timestamp[2]
+        )
+        self.pending_cache_key = f"{self.location} {date}T{timestamp[3]:02d} {timezone}"
+        self.pending_cache_time = time.time() # Sending time, so the cache age follows the update schedule
+        if self.__cache_valid(self.pending_cache_key):
+            return None
+
+        return [
+            self.request_manager.start_request(self.base_url_current_weather),
+            self.request_manager.start_request(f"{self.base_url_weather}&date={date}&tz={timezone}")
+        ]
+
+    async def finish_request(self, pending_requests, timestamp):
+        """
+        Receives and processes the responses of the requests sent by `start_request`.
+
+        Args:
+            pending_requests (list or None): The pending requests returned by `start_request`.
+            timestamp (tuple): The time tuple that was passed to `start_request`.
+
         Returns:
             tuple: A tuple containing a list of weather data [current_temp, rain_prob, min_temp, max_temp] and the weather icon name.
         """
+        if pending_requests is None:
+            return list(self.cache["weather_data"]), self.cache["weather_icon_name"]
+
         date = "{:04d}-{:02d}-{:02d}".format(
             timestamp[0], timestamp[1], timestamp[2]
         )
+        current_weather_request, weather_request = pending_requests
         try:
-            response = requests.get(self.base_url_current_weather)
-            data = response.json()
-            response.close()
+            data = await self.request_manager.finish_request(current_weather_request)
             current_temperature = self.__get_current_temperature(data)
             weather_icon_name = self.__get_weather_icon(data)
         except Exception:
@@ -148,13 +215,14 @@ class WeatherManager:
             weather_icon_name = "unknown"
 
         try:
-            response = requests.get(f"{self.base_url_weather}&date={date}&tz={timezone}")
-            data = response.json()
-            response.close()
+            data = await self.request_manager.finish_request(weather_request)
             rain_probability = self.__get_rain_probability(data, timestamp[3])
             min_temp, max_temp = self.__get_min_max_temperature(data, current_temperature, date)
         except Exception:
             rain_probability, min_temp, max_temp = "----", "----", "----"
 
-        return [current_temperature, rain_probability, min_temp, max_temp], weather_icon_name
+        weather_data = [current_temperature, rain_probability, min_temp, max_temp]
+        if "----" not in weather_data:
+            self.__save_cache(self.pending_cache_key, self.pending_cache_time, weather_data, weather_icon_name)
 
+        return weather_data, weather_icon_name
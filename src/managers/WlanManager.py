@@ -1,12 +1,21 @@
 # Import required libraries
-import network, time, socket
+import network, time, socket, struct
 
 class WlanManager:
     """Manages WLAN (Wi-Fi) connections for the device."""
-    def __init__(self):
+    __PROBE_SERVER = "1.1.1.1" # Public DNS server that is queried to check the internet connection
+    __PROBE_QUESTION = b"\x04pool\x03ntp\x03org\x00\x00\x01\x00\x01" # DNS question: pool.ntp.org, type A, class IN
+
+    def __init__(self, request_timeout):
         """
         Initializes the WlanManager, deactivating and then activating the WLAN interface.
+
+        Args:
+            request_timeout (int): The timeout in seconds for the internet connection check.
         """
+        self.request_timeout = request_timeout
+        self.probe_sock = None
+        self.probe_id = 0
         self.wlan = network.WLAN(network.STA_IF)
         self.was_connected_before = False
         if self.wlan.active():
@@ -69,26 +78,46 @@ class WlanManager:
 
     def device_online(self):
         """
-        Checks if the device has an active internet connection by attempting to reach a public IP.
+        Checks if the device has an active internet connection by sending a small DNS query to a public DNS server.
+        The UDP socket is kept open and reused for later checks.
 
         Returns:
             tuple: A tuple containing an error code (or "OK") and a list of error messages (or None).
         """
         try:
-            addr = socket.getaddrinfo("1.1.1.1", 53)[0][-1]
-            socket.socket().connect(addr)
+            if self.probe_sock is None:
+                self.probe_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self.probe_sock.settimeout(self.request_timeout)
+                self.probe_sock.connect(socket.getaddrinfo(self.__PROBE_SERVER, 53)[0][-1])
+
+            # Header: ID, flags (recursion desired), one question, no other records
+            self.probe_id = (self.probe_id + 1) & 0xFFFF
+            query = struct.pack("!HHHHHH", self.probe_id, 0x0100, 1, 0, 0, 0) + self.__PROBE_QUESTION
+            self.probe_sock.send(query)
+            while self.probe_sock.recv(512)[:2] != query[:2]:
+                pass # Skip late answers to earlier queries, a timeout raises an exception
             return "OK", None
         
         except Exception as e:
+            self.__close_probe_sock()
             return "2401", ["No internet conenction!",
                         "Although your WLAN works, there is no",
                         "internet connection. Please restart your",
                         "WLAN router and check for an outage."]
+
+    def __close_probe_sock(self):
+        """
+        Closes the socket used for the internet connection check, if it is open.
+        """
+        if self.probe_sock is not None:
+            self.probe_sock.close()
+            self.probe_sock = None
         
     def close(self):
         """
         Disconnects from the WLAN and deactivates the WLAN interface.
         """
+        self.__close_probe_sock()
         if self.wlan.isconnected():
             self.wlan.disconnect()
         self.wlan.active(False)
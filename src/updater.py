@@ -7,15 +7,21 @@ class UpdateManager:
 
     __HEADERS = {"User-Agent": "ESP32-OTA-Updater"} # Custom User-Agent for API requests
     __OTA_API_URL = "https://api.github.com/repos/smolinde/iot-dashboard/releases/latest" # GitHub API endpoint for latest release
+    __CHUNK_SIZE = 8192 # Size in bytes of the chunks the update file is downloaded, hashed, and written in
 
-    def __init__(self):
+    def __init__(self, request_timeout):
         """
         Initializes the UpdateManager, preparing attributes to store release information.
+
+        Args:
+            request_timeout (int): The timeout in seconds for network requests.
         """
+        self.request_timeout = request_timeout # Timeout in seconds for the GitHub API and download requests
         self.tag_name = None # Stores the tag name (version) of the latest release
         self.name = None # Stores the name of the release asset file
         self.browser_download_url = None # Stores the download URL for the release asset
         self.digest = None # Stores the SHA256 digest of the release asset for verification
+        self.update_sha = None # Stores the SHA256 digest of the downloaded update file
 
     def update_available(self):
         """
@@ -36,7 +42,7 @@ class UpdateManager:
 
         try:
             # Fetch latest release information from GitHub API
-            response = requests.get(self.__OTA_API_URL, headers = self.__HEADERS)
+            response = requests.get(self.__OTA_API_URL, headers = self.__HEADERS, timeout = self.request_timeout)
             data = response.json()
             response.close()
             
@@ -53,16 +59,27 @@ class UpdateManager:
     def download_update(self):
         """
         Downloads the firmware update file from the specified URL.
+        The file is streamed to the root directory in chunks and hashed on the way,
+        so it is never held in RAM as a whole and doesn't have to be read again for verification.
 
         Returns:
             tuple: "OK" and None on success, or an error code and message on failure.
         """
         try:
-            response = requests.get(self.browser_download_url, headers = self.__HEADERS)
-            # Write the downloaded content to a file in the root directory
+            response = requests.get(self.browser_download_url, headers = self.__HEADERS, timeout = self.request_timeout)
+            sha256 = hashlib.sha256()
+            chunk = bytearray(self.__CHUNK_SIZE)
+            chunk_view = memoryview(chunk)
+            # Write the downloaded content to a file in the root directory and calculate its SHA256 hash
             with open("/" + self.name, "wb") as f:
-                f.write(response.content)
+                while True:
+                    size = response.raw.readinto(chunk)
+                    if not size:
+                        break
+                    f.write(chunk_view[:size])
+                    sha256.update(chunk_view[:size])
             response.close()
+            self.update_sha = ubinascii.hexlify(sha256.digest()).decode()
             return "OK", None
         except Exception:
             return "2601", ["Update Download Failed!",
@@ -72,21 +89,12 @@ class UpdateManager:
 
     def verify_update(self):
         """
-        Verifies the integrity of the downloaded update file using its SHA256 hash.
+        Verifies the integrity of the downloaded update file using the SHA256 hash calculated during the download.
 
         Returns:
             tuple: "OK" and None on success, or an error code and message on failure.
         """
-        sha256 = hashlib.sha256()
-        # Calculate SHA256 hash of the downloaded file
-        with open("/" + self.name, 'rb') as f:
-            while True:
-                chunk = f.read(8192) # Read in chunks to handle large files
-                if not chunk:
-                    break
-                sha256.update(chunk)
-
-        update_sha = ubinascii.hexlify(sha256.digest()).decode()
+        update_sha = self.update_sha
         # Compare calculated hash with the expected digest
         if update_sha == self.digest:
             return "OK", None